@@ -122,6 +122,11 @@ print(f"Conversion prompt YAML: {conversion_prompt_yaml}")
 
 
 # DBTITLE 1,Helper Functions for File Operations
+# Single workspace client shared by scanning, reading, and exporting;
+# constructing one per call re-runs SDK config resolution every time
+ws_client = WorkspaceClient()
+
+
 def is_databricks_notebook(content: str) -> bool:
     """Check if the content is from a Databricks notebook."""
     # Check for Databricks notebook source marker in first few lines
@@ -151,8 +156,7 @@ def read_notebook_content(file_path: str) -> Tuple[str, int]:
     Returns tuple of (content, size_in_bytes)
     """
     try:
-        w = WorkspaceClient()
-        export_response = w.workspace.export(file_path, format=workspace.ExportFormat.SOURCE)
+        export_response = ws_client.workspace.export(file_path, format=workspace.ExportFormat.SOURCE)
 
         # Handle both old and new SDK versions
         if hasattr(export_response, 'content'):
@@ -162,10 +166,11 @@ def read_notebook_content(file_path: str) -> Tuple[str, int]:
 
         # Handle both string and bytes
         if isinstance(content_data, str):
-            # Check if it's base64 encoded
+            # Check if it's base64 encoded; validate=True rejects strings with
+            # non-alphabet characters instead of silently skipping them, so
+            # plain source text reliably takes the fallback path
             try:
-                # Try to decode as base64
-                decoded_bytes = base64.b64decode(content_data)
+                decoded_bytes = base64.b64decode(content_data, validate=True)
                 content = decoded_bytes.decode('utf-8')
                 size_bytes = len(decoded_bytes)
             except Exception:
@@ -188,11 +193,10 @@ def list_python_notebooks(directory: str) -> List[Dict[str, Any]]:
     Returns a list of dictionaries with file information.
     """
     notebooks = []
-    w = WorkspaceClient()
 
     try:
         # List all files in the directory
-        items = w.workspace.list(directory, recursive=True)
+        items = ws_client.workspace.list(directory, recursive=True)
 
         for item in items:
             if item.object_type == workspace.ObjectType.NOTEBOOK and item.language == workspace.Language.PYTHON:
@@ -338,8 +342,9 @@ for i, result in enumerate(conversion_results):
         # Get metadata from the original request
         metadata = conversion_requests[i].metadata
 
-        # Check if result has content (success case)
-        if hasattr(result, 'content') and result.content:
+        # BatchInferenceResponse always defines content and error, so check
+        # the values directly (success case first)
+        if result.content:
             sql_notebooks.append(
                 {
                     "python_notebook_path": metadata["python_notebook_path"],
@@ -348,7 +353,7 @@ for i, result in enumerate(conversion_results):
                     "size_mb": metadata["size_mb"],
                 }
             )
-        elif hasattr(result, 'error') and result.error:
+        elif result.error:
             # Error case
             conversion_errors.append(
                 {"python_notebook_path": metadata["python_notebook_path"], "error": str(result.error)}
@@ -386,6 +391,9 @@ if conversion_errors:
 if sql_notebooks:
     export_results = []
 
+    # Each unique parent directory needs only one mkdirs API call
+    created_dirs = set()
+
     for notebook in sql_notebooks:
         try:
             # Determine output path for SQL notebook
@@ -397,21 +405,20 @@ if sql_notebooks:
 
             sql_output_path = f"{sql_output_dir.rstrip('/')}/{sql_relative_path}"
 
-            # Export notebook directly using WorkspaceClient
-            w = WorkspaceClient()
-
             # Ensure directory exists by creating parent path
             parent_path = "/".join(sql_output_path.split("/")[:-1])
-            try:
-                w.workspace.mkdirs(parent_path)
-            except Exception:
-                pass  # Directory might already exist
+            if parent_path not in created_dirs:
+                try:
+                    ws_client.workspace.mkdirs(parent_path)
+                except Exception:
+                    pass  # Directory might already exist
+                created_dirs.add(parent_path)
 
             # Encode content as base64
             encoded_content = base64.b64encode(notebook["sql_content"].encode('utf-8')).decode('utf-8')
 
             # Export as SQL notebook
-            w.workspace.import_(
+            ws_client.workspace.import_(
                 content=encoded_content,
                 path=sql_output_path,
                 format=workspace.ImportFormat.SOURCE,
@@ -547,6 +554,6 @@ else:
 
 # Return results as JSON
 if 'export_results' in locals():
-    dbutils.notebook.exit(json.dumps(export_results))
+    dbutils.notebook.exit(json.dumps(export_results, separators=(',', ':')))
 else:
     dbutils.notebook.exit(json.dumps([]))
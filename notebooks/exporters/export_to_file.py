@@ -179,5 +179,5 @@ results_df.display()
 # Update result_table with export results
 processor = ExportResultProcessor(target_type="file")
 source_sdf = spark.table(result_table)
-updated_sdf = processor.process_export_results(source_sdf, json.dumps(export_results))
+updated_sdf = processor.process_export_results(source_sdf, json.dumps(export_results, separators=(',', ':')))
 updated_sdf.write.mode("overwrite").saveAsTable(result_table)
@@ -33,6 +33,7 @@ sys.path.append(os.path.dirname(os.getcwd()))
 
 # DBTITLE 1,Import Libraries
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from databricks.sdk import WorkspaceClient
@@ -105,17 +106,31 @@ results = helper.process_notebooks(exporter_inputs)
 # DBTITLE 1,Export Notebooks
 ws_client = WorkspaceClient()
 
+# Track directories already created so each unique parent costs one
+# filesystem call instead of one per exported notebook
+created_dirs = set()
+
+# The notebook language is fixed for the whole export; resolve it once
+language = workspace.Language.SQL if notebook_language == "sql" else workspace.Language.PYTHON
+
+# First pass: create directories and screen out oversized content
+exportable_outputs = []
 for output in results:
     # Create directories if they don't exist
-    os.makedirs(os.path.dirname(output.output_file_path), exist_ok=True)
+    output_dir_path = os.path.dirname(output.output_file_path)
+    if output_dir_path not in created_dirs:
+        os.makedirs(output_dir_path, exist_ok=True)
+        created_dirs.add(output_dir_path)
 
     # Check the size of the encoded content
     if output.base64_encoded_content_size > 10 * 1024 * 1024:
         output.export_error = "Content size exceeds 10MB limit"
         continue
 
-    language = workspace.Language.SQL if notebook_language == "sql" else workspace.Language.PYTHON
+    exportable_outputs.append(output)
+
 
+def export_notebook(output):
     try:
         # Export notebook
         ws_client.workspace.import_(
@@ -130,6 +145,13 @@ for output in results:
     except Exception as e:
         output.export_error = str(e)
 
+
+# Each import is an independent API round trip, so issue them concurrently;
+# total export time becomes the slowest call instead of the sum
+if exportable_outputs:
+    with ThreadPoolExecutor(max_workers=min(8, len(exportable_outputs))) as executor:
+        list(executor.map(export_notebook, exportable_outputs))
+
 # COMMAND ----------
 
 # DBTITLE 1,Display Export Results
@@ -153,5 +175,5 @@ display(pd.DataFrame(export_results_dict))
 # Update result_table with export results
 processor = ExportResultProcessor(target_type="notebook")
 source_sdf = spark.table(result_table)
-updated_sdf = processor.process_export_results(source_sdf, json.dumps(export_results_dict))
+updated_sdf = processor.process_export_results(source_sdf, json.dumps(export_results_dict, separators=(',', ':')))
 updated_sdf.write.mode("overwrite").saveAsTable(result_table)
@@ -11,9 +11,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pyspark.sql import DataFrame
-from pyspark.sql.functions import coalesce, col, lit, try_divide, udf, when
+from pyspark.sql.functions import coalesce, col, length, lit, try_divide, udf, when
 from pyspark.sql.types import (
     ArrayType,
+    BooleanType,
+    DoubleType,
     FloatType,
     IntegerType,
     LongType,
@@ -54,7 +56,7 @@ def clean_conversion_results(target_table: str, size_ratio_threshold: float = 0.
 
     # Compare the sizes of the original and cleaned content. If the cleaned content　is under the threshold, print a warning.
     small_content_files_df = compare_content_sizes(original_df, cleaned_df, "result_content", size_ratio_threshold)
-    if small_content_files_df.count() > 0:
+    if not small_content_files_df.isEmpty():
         print(
             f"Warning: The following files have cleaned content sizes less than "
             f"{size_ratio_threshold * 100}% of their original sizes, "
@@ -91,14 +93,12 @@ def compare_content_sizes(df1: DataFrame, df2: DataFrame, col_name: str, thresho
         DataFrame: A DataFrame containing rows where the size ratio is below the threshold.
     """
 
-    def safe_len(value):
-        if value is None:
-            return 0
-        return len(value)
-
-    size_udf = udf(safe_len, IntegerType())
-    df1 = df1.select("input_file_number", "input_file_path", size_udf(col(col_name)).alias("original_content_size"))
-    df2 = df2.select("input_file_number", size_udf(col(col_name)).alias("cleaned_content_size"))
+    # Use the built-in length() (null-safe via coalesce) instead of a Python
+    # UDF so the size computation stays inside the JVM without row-by-row
+    # serialization
+    content_size = coalesce(length(col(col_name)), lit(0))
+    df1 = df1.select("input_file_number", "input_file_path", content_size.alias("original_content_size"))
+    df2 = df2.select("input_file_number", content_size.alias("cleaned_content_size"))
     return (
         df1.join(df2, on="input_file_number")
         .filter(try_divide(col("cleaned_content_size"), col("original_content_size")) < threshold)
@@ -117,6 +117,43 @@ class BatchInferenceResultProcessor:
     A class to process batch inference results and merge them with source data in a Databricks environment.
     """
 
+    # Columns replaced by update expressions, excluded from the source
+    # passthrough; frozenset gives O(1) membership per source column
+    EXCLUDED_COLUMNS = frozenset(
+        [
+            "is_conversion_target",
+            "result_content",
+            "result_prompt_tokens",
+            "result_completion_tokens",
+            "result_total_tokens",
+            "result_processing_time_seconds",
+            "result_timestamp",
+            "result_error",
+            "result_python_parse_error",
+            "result_extracted_sqls",
+            "result_sql_parse_errors",
+            "model_serving_endpoint_for_conversion",
+            "model_serving_endpoint_for_fix",
+            "request_params_for_conversion",
+            "request_params_for_fix",
+        ]
+    )
+
+    # Result schema is identical for every processor instance; build it once
+    # at class definition instead of per __init__
+    RESULT_SCHEMA = StructType(
+        [
+            StructField("input_file_number", LongType(), True),
+            StructField("result_content", StringType(), True),
+            StructField("result_prompt_tokens", IntegerType(), True),
+            StructField("result_completion_tokens", IntegerType(), True),
+            StructField("result_total_tokens", IntegerType(), True),
+            StructField("result_processing_time_seconds", FloatType(), True),
+            StructField("result_timestamp", TimestampType(), True),
+            StructField("result_error", StringType(), True),
+        ]
+    )
+
     def __init__(
         self,
         model_serving_endpoint_for_conversion: Optional[str] = None,
@@ -144,18 +181,11 @@ class BatchInferenceResultProcessor:
             json.dumps(request_params_for_fix) if request_params_for_fix is not None else None
         )
 
-        self.schema = StructType(
-            [
-                StructField("input_file_number", LongType(), True),
-                StructField("result_content", StringType(), True),
-                StructField("result_prompt_tokens", IntegerType(), True),
-                StructField("result_completion_tokens", IntegerType(), True),
-                StructField("result_total_tokens", IntegerType(), True),
-                StructField("result_processing_time_seconds", FloatType(), True),
-                StructField("result_timestamp", TimestampType(), True),
-                StructField("result_error", StringType(), True),
-            ]
-        )
+        self.schema = self.RESULT_SCHEMA
+
+        # Update expressions depend only on the endpoints and request params
+        # fixed at construction, so build the column list once up front
+        self._update_columns = self._build_update_columns()
 
     def process_results(self, source_sdf: DataFrame, responses: List[BatchInferenceResponse]) -> DataFrame:
         """
@@ -198,6 +228,10 @@ class BatchInferenceResultProcessor:
 
     def _get_update_columns(self) -> List:
         """Get the list of columns to update or add."""
+        return self._update_columns
+
+    def _build_update_columns(self) -> List:
+        """Build the update/add column expressions once at construction."""
         return [
             # Update conversion target flag based on successful conversion
             when((col("result.result_content").isNotNull()) & (col("result.result_error").isNull()), lit(False))
@@ -245,24 +279,7 @@ class BatchInferenceResultProcessor:
 
     def _get_select_columns(self, source_sdf: DataFrame, update_columns: List) -> List:
         """Get the list of columns to select in the final DataFrame."""
-        excluded_columns = [
-            "is_conversion_target",
-            "result_content",
-            "result_prompt_tokens",
-            "result_completion_tokens",
-            "result_total_tokens",
-            "result_processing_time_seconds",
-            "result_timestamp",
-            "result_error",
-            "result_python_parse_error",
-            "result_extracted_sqls",
-            "result_sql_parse_errors",
-            "model_serving_endpoint_for_conversion",
-            "model_serving_endpoint_for_fix",
-            "request_params_for_conversion",
-            "request_params_for_fix",
-        ]
-        select_columns = [col("source." + c) for c in source_sdf.columns if c not in excluded_columns]
+        select_columns = [col("source." + c) for c in source_sdf.columns if c not in self.EXCLUDED_COLUMNS]
         select_columns.extend(update_columns)
         return select_columns
 
@@ -273,6 +290,30 @@ class ExportResultProcessor:
     Processes main export results (notebook/file) only.
     """
 
+    # Columns replaced by update expressions, excluded from the source passthrough
+    EXCLUDED_COLUMNS = frozenset(
+        [
+            "export_output_path",
+            "export_status",
+            "export_error",
+            "export_timestamp",
+            "export_content_size_bytes",
+        ]
+    )
+
+    # Export schema is identical for every processor instance; build it once
+    # at class definition instead of per __init__
+    EXPORT_SCHEMA = StructType(
+        [
+            StructField("input_file_path", StringType(), True),
+            StructField("export_output_path", StringType(), True),
+            StructField("export_status", StringType(), True),
+            StructField("export_error", StringType(), True),
+            StructField("export_timestamp", TimestampType(), True),
+            StructField("export_content_size_bytes", LongType(), True),
+        ]
+    )
+
     def __init__(self, target_type: str):
         """
         Initialize the ExportResultProcessor.
@@ -281,16 +322,10 @@ class ExportResultProcessor:
             target_type (str): Target type - "notebook" or "file" or "sdp"
         """
         self.target_type = target_type
-        self.schema = StructType(
-            [
-                StructField("input_file_path", StringType(), True),
-                StructField("export_output_path", StringType(), True),
-                StructField("export_status", StringType(), True),
-                StructField("export_error", StringType(), True),
-                StructField("export_timestamp", TimestampType(), True),
-                StructField("export_content_size_bytes", LongType(), True),
-            ]
-        )
+        self.schema = self.EXPORT_SCHEMA
+
+        # The export update expressions are fully static; build them once
+        self._update_columns = self._build_update_columns()
 
     def process_export_results(self, source_sdf: DataFrame, export_results_json: str) -> DataFrame:
         """
@@ -313,35 +348,38 @@ class ExportResultProcessor:
     def _create_export_dataframe(self, export_results: List[Dict]) -> DataFrame:
         """Create a DataFrame from export results."""
         current_time = datetime.now()
-        export_data = []
-
-        for result in export_results:
-            # Normalize different export result formats
-            if self.target_type in ["notebook", "sdp"]:
-                # From export_to_notebook.py
-                export_data.append(
-                    (
-                        result.get("input_file_path"),
-                        result.get("output_file_path"),
-                        "exported" if result.get("export_succeeded", False) else "export_failed",
-                        result.get("export_error"),
-                        current_time,
-                        result.get("base64_encoded_content_size", 0),
-                    )
+
+        # Select the row builder for the target type once instead of
+        # re-branching on self.target_type for every result row
+        if self.target_type in ("notebook", "sdp"):
+            # From export_to_notebook.py
+            def build_row(result: Dict) -> tuple:
+                return (
+                    result.get("input_file_path"),
+                    result.get("output_file_path"),
+                    "exported" if result.get("export_succeeded", False) else "export_failed",
+                    result.get("export_error"),
+                    current_time,
+                    result.get("base64_encoded_content_size", 0),
                 )
-            elif self.target_type == "file":
-                # From export_to_file.py
-                export_data.append(
-                    (
-                        result.get("input_file_path"),
-                        result.get("output_file_path"),
-                        result.get("export_status", "export_failed"),
-                        result.get("export_error"),
-                        current_time,
-                        result.get("content_size_bytes", 0),
-                    )
+
+        elif self.target_type == "file":
+            # From export_to_file.py
+            def build_row(result: Dict) -> tuple:
+                return (
+                    result.get("input_file_path"),
+                    result.get("output_file_path"),
+                    result.get("export_status", "export_failed"),
+                    result.get("export_error"),
+                    current_time,
+                    result.get("content_size_bytes", 0),
                 )
 
+        else:
+            def build_row(result: Dict) -> tuple:  # pylint: disable=unused-argument
+                return None
+
+        export_data = [row for row in (build_row(result) for result in export_results) if row is not None]
         return spark.createDataFrame(export_data, schema=self.schema)
 
     def _join_dataframes(self, source_sdf: DataFrame, export_sdf: DataFrame) -> DataFrame:
@@ -352,6 +390,10 @@ class ExportResultProcessor:
 
     def _get_update_columns(self) -> List:
         """Get the list of columns to update or add."""
+        return self._update_columns
+
+    def _build_update_columns(self) -> List:
+        """Build the update/add column expressions once at construction."""
         return [
             coalesce(col("export.export_output_path"), col("source.export_output_path")).alias("export_output_path"),
             coalesce(col("export.export_status"), col("source.export_status")).alias("export_status"),
@@ -364,14 +406,7 @@ class ExportResultProcessor:
 
     def _get_select_columns(self, source_sdf: DataFrame, update_columns: List) -> List:
         """Get the list of columns to select in the final DataFrame."""
-        excluded_columns = [
-            "export_output_path",
-            "export_status",
-            "export_error",
-            "export_timestamp",
-            "export_content_size_bytes",
-        ]
-        select_columns = [col("source." + c) for c in source_sdf.columns if c not in excluded_columns]
+        select_columns = [col("source." + c) for c in source_sdf.columns if c not in self.EXCLUDED_COLUMNS]
         select_columns.extend(update_columns)
         return select_columns
 
@@ -478,11 +513,20 @@ def display_sql_conversion_summary(sql_results_json: str, sql_output_dir: str):
             f'<p><strong>SQL Output Directory URL: </strong><a href="{full_url}" target="_blank">{full_url}</a></p>'
         )
 
-        # Display detailed results table
-        import pandas as pd
-
-        sql_df = pd.DataFrame(sql_results)
-        spark.createDataFrame(sql_df).createOrReplaceTempView("temp_sql_results")
+        # Display detailed results table; build the DataFrame straight from
+        # the result dicts instead of bouncing through pandas. The schema is
+        # explicit because the error field is None in every row on an
+        # all-success run and schema inference cannot determine its type.
+        sql_results_schema = StructType(
+            [
+                StructField("python_notebook_path", StringType(), True),
+                StructField("sql_output_path", StringType(), True),
+                StructField("success", BooleanType(), True),
+                StructField("error", StringType(), True),
+                StructField("size_mb", DoubleType(), True),
+            ]
+        )
+        spark.createDataFrame(sql_results, schema=sql_results_schema).createOrReplaceTempView("temp_sql_results")
 
         spark.sql(
             """
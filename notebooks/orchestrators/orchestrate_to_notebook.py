@@ -401,4 +401,4 @@ else:
 import json
 
 orchestrator_results = {"result_table": result_table, "sql_conversion_results": sql_conversion_results}
-dbutils.notebook.exit(json.dumps(orchestrator_results))
+dbutils.notebook.exit(json.dumps(orchestrator_results, separators=(',', ':')))
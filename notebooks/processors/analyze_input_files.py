@@ -47,8 +47,6 @@ from pyspark.sql.types import (
     TimestampType,
     FloatType,
 )
-from pyspark.sql.utils import AnalysisException
-
 from pyscripts.helpers.llm_token_count_helper import FileTokenCountHelper
 from pyscripts.types.source_format import SourceFormat
 from pyscripts.types.table_config import TableConfig
@@ -116,14 +114,13 @@ input_dir, endpoint_name, file_encoding, source_format, token_count_threshold, r
 
 # DBTITLE 1,Check Result Table Existance
 if existing_result_table:
-    try:
-        spark.table(existing_result_table)
+    # Ask the catalog directly instead of resolving the table and catching
+    # the AnalysisException on the missing-table path
+    if spark.catalog.tableExists(existing_result_table):
         dbutils.notebook.exit(existing_result_table)
-    except AnalysisException:
-        print(
-            "'existing_result_table' is specified but the table does not exist. Continuing with the notebook processing."
-        )
-        pass
+    print(
+        "'existing_result_table' is specified but the table does not exist. Continuing with the notebook processing."
+    )
 else:
     print("The parameter 'existing_result_table' is not specified. Continuing with the notebook processing.")
 
@@ -199,33 +196,35 @@ schema = StructType(
     ]
 )
 
-result_df = (
-    spark.createDataFrame(results, schema=schema)
-    .withColumn("input_file_relative_path", calculate_relative_path_udf(col("input_file_path")))
-    .withColumn(
-        "is_conversion_target",
-        when(col("input_file_token_count_preprocessed") > token_count_threshold, False).otherwise(True),
-    )
-    .withColumn("model_serving_endpoint_for_conversion", lit(None).cast(StringType()))
-    .withColumn("model_serving_endpoint_for_fix", lit(None).cast(StringType()))
-    .withColumn("request_params_for_conversion", lit(None).cast(StringType()))
-    .withColumn("request_params_for_fix", lit(None).cast(StringType()))
-    .withColumn("result_content", lit(None).cast(StringType()))
-    .withColumn("result_prompt_tokens", lit(None).cast(IntegerType()))
-    .withColumn("result_completion_tokens", lit(None).cast(IntegerType()))
-    .withColumn("result_total_tokens", lit(None).cast(IntegerType()))
-    .withColumn("result_processing_time_seconds", lit(None).cast(FloatType()))
-    .withColumn("result_timestamp", lit(None).cast(TimestampType()))
-    .withColumn("result_error", lit(None).cast(StringType()))
-    .withColumn("result_python_parse_error", lit(None).cast(StringType()))
-    .withColumn("result_extracted_sqls", lit(None).cast(ArrayType(StringType())))
-    .withColumn("result_sql_parse_errors", lit(None).cast(ArrayType(StringType())))
-    .withColumn("result_sdp_errors", lit(None).cast(ArrayType(StringType())))
-    .withColumn("export_output_path", lit(None).cast(StringType()))
-    .withColumn("export_status", lit(None).cast(StringType()))
-    .withColumn("export_error", lit(None).cast(StringType()))
-    .withColumn("export_timestamp", lit(None).cast(TimestampType()))
-    .withColumn("export_content_size_bytes", lit(None).cast(LongType()))
+# Apply all derived and placeholder columns in one withColumns call so the
+# plan gets a single projection instead of one per chained withColumn
+result_df = spark.createDataFrame(results, schema=schema).withColumns(
+    {
+        "input_file_relative_path": calculate_relative_path_udf(col("input_file_path")),
+        "is_conversion_target": when(
+            col("input_file_token_count_preprocessed") > token_count_threshold, False
+        ).otherwise(True),
+        "model_serving_endpoint_for_conversion": lit(None).cast(StringType()),
+        "model_serving_endpoint_for_fix": lit(None).cast(StringType()),
+        "request_params_for_conversion": lit(None).cast(StringType()),
+        "request_params_for_fix": lit(None).cast(StringType()),
+        "result_content": lit(None).cast(StringType()),
+        "result_prompt_tokens": lit(None).cast(IntegerType()),
+        "result_completion_tokens": lit(None).cast(IntegerType()),
+        "result_total_tokens": lit(None).cast(IntegerType()),
+        "result_processing_time_seconds": lit(None).cast(FloatType()),
+        "result_timestamp": lit(None).cast(TimestampType()),
+        "result_error": lit(None).cast(StringType()),
+        "result_python_parse_error": lit(None).cast(StringType()),
+        "result_extracted_sqls": lit(None).cast(ArrayType(StringType())),
+        "result_sql_parse_errors": lit(None).cast(ArrayType(StringType())),
+        "result_sdp_errors": lit(None).cast(ArrayType(StringType())),
+        "export_output_path": lit(None).cast(StringType()),
+        "export_status": lit(None).cast(StringType()),
+        "export_error": lit(None).cast(StringType()),
+        "export_timestamp": lit(None).cast(TimestampType()),
+        "export_content_size_bytes": lit(None).cast(LongType()),
+    }
 )
 
 display(result_df)
@@ -240,7 +239,7 @@ display(result_df)
 
 # DBTITLE 1,Warning for Token Count Threshold
 warning_df = result_df.filter(col("is_conversion_target") == False)
-if warning_df.count() > 0:
+if not warning_df.isEmpty():
     print(
         f"Warning: The following files do not meet the token count threshold of "
         f"{token_count_threshold} and are excluded from conversion process."
@@ -145,7 +145,7 @@ input_sdf = spark.sql(
 display(input_sdf)
 
 # Check if there are any records
-if input_sdf.count() == 0:
+if input_sdf.isEmpty():
     raise Exception(
         "No records found for conversion. Please check if there are any records with is_conversion_target = true in the result table."
     )
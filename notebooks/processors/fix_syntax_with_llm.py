@@ -122,9 +122,8 @@ Instructions:
 
 Errors to fix:
 """
-    for err in sdp_errors:
-        message += f"{err}\n"
-    return message
+    # Join once instead of growing the message string per error
+    return message + "".join(f"{err}\n" for err in sdp_errors)
 
 
 def create_system_message_for_python_notebook(python_error: Optional[str], sql_error: Optional[str]) -> str:
@@ -141,11 +140,8 @@ Instructions:
 
 Errors to fix:
 """
-    if python_error:
-        message += f"{python_error}\n"
-    if sql_error:
-        message += f"{sql_error}\n"
-    return message
+    errors = [error for error in (python_error, sql_error) if error]
+    return message + "".join(f"{error}\n" for error in errors)
 
 
 def create_system_message(
@@ -38,6 +38,7 @@ sys.path.append(os.path.dirname(os.getcwd()))
 # COMMAND ----------
 
 # DBTITLE 1,Import Libraries
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 from pyspark.sql import DataFrame
@@ -123,9 +124,7 @@ display(new_df)
 # DBTITLE 1,Define SQL Parse Function
 # Function to parse SQL statements on the driver
 def parse_sql_statements(df: DataFrame) -> List[Tuple[str, List[str]]]:
-    result = []
-    rows = df.collect()
-    for row in rows:
+    def parse_row(row) -> Tuple[str, List[str]]:
         errors_for_row = []
         for idx, sql in enumerate(row['result_extracted_sqls']):
             try:
@@ -138,8 +137,17 @@ def parse_sql_statements(df: DataFrame) -> List[Tuple[str, List[str]]]:
                 if jvm_index != -1:
                     error_message = error_message[:jvm_index].strip()
                 errors_for_row.append(f"Error in query {idx}: {error_message}")
-        result.append((row["input_file_number"], errors_for_row))
-    return result
+        return (row["input_file_number"], errors_for_row)
+
+    rows = df.collect()
+    if not rows:
+        return []
+
+    # Each EXPLAIN is a driver round trip; validating rows on a thread pool
+    # overlaps those waits while executor.map keeps results in row order
+    max_workers = min(8, len(rows))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_row, rows))
 
 
 # COMMAND ----------
@@ -10,6 +10,7 @@
 
 # DBTITLE 1,SDP APIs
 import json
+import uuid
 from typing import Any, Dict, Optional
 
 import requests
@@ -28,6 +29,11 @@ DEFAULT_HEADERS = {
     "Content-Type": "application/json",
 }
 
+# One session for all pipeline API calls; keep-alive reuses the TCP/TLS
+# connection instead of a fresh handshake per request, which matters for
+# the polling loop below
+_session = requests.Session()
+
 DEBUG = False
 
 
@@ -75,7 +81,7 @@ def _request(
     url = f"{API_BASE_URL}{path}"
     all_headers = {**DEFAULT_HEADERS, **(headers or {})}
 
-    response = requests.request(
+    response = _session.request(
         method=method,
         url=url,
         headers=all_headers,
@@ -248,7 +254,7 @@ normalized_output_ws_dir = output_ws_dir.rstrip("/")
 glob_include_path = f"{normalized_output_ws_dir}/**"
 
 pipeline_spec = {
-    "name": f"_Lakebridge_Switch_SDP_Conversion_Validate_{__import__('uuid').uuid4().hex}",
+    "name": f"_Lakebridge_Switch_SDP_Conversion_Validate_{uuid.uuid4().hex}",
     "libraries": [{"glob": {"include": glob_include_path}}],
     "catalog": catalog,
     "schema": schema,
@@ -258,7 +264,7 @@ pipeline_spec = {
     "continuous": False,
 }
 
-pipeline_id = create_pipeline(json.dumps(pipeline_spec))
+pipeline_id = create_pipeline(json.dumps(pipeline_spec, separators=(',', ':')))
 print("Created pipeline for validation:", pipeline_id)
 
 
@@ -271,7 +277,18 @@ import time
 update_id = validate_pipeline(pipeline_id)
 
 TERMINAL_STATES = {"COMPLETED", "FAILED", "CANCELED"}
+
+# Poll with exponential backoff: the short initial interval catches fast
+# validations almost immediately, while the growing interval keeps long
+# validations from hammering the API. The timeout caps waits on stuck updates.
+POLL_INITIAL_INTERVAL_SECONDS = 1
+POLL_MAX_INTERVAL_SECONDS = 60
+POLL_BACKOFF_MULTIPLIER = 1.5
+POLL_TIMEOUT_SECONDS = 1800
+
 payload: Dict[str, Any] = {}
+poll_interval = POLL_INITIAL_INTERVAL_SECONDS
+poll_deadline = time.monotonic() + POLL_TIMEOUT_SECONDS
 
 while True:
     raw = get_pipeline_update(pipeline_id, update_id)  # returns dict like {"update": {...}}
@@ -284,7 +301,13 @@ while True:
     if state in TERMINAL_STATES:
         payload = update  # keep final state in payload for later logic
         break
-    time.sleep(5)
+    if time.monotonic() >= poll_deadline:
+        raise RuntimeError(
+            f"Timed out after {POLL_TIMEOUT_SECONDS}s waiting for pipeline update "
+            f"{update_id} to reach a terminal state (last state: {state})."
+        )
+    time.sleep(poll_interval)
+    poll_interval = min(poll_interval * POLL_BACKOFF_MULTIPLIER, POLL_MAX_INTERVAL_SECONDS)
 
 # Collect failure events if the update failed
 failure_events: list[str] = []
@@ -10,6 +10,7 @@ Key components:
 import asyncio
 import json
 import logging
+import re
 import time
 import traceback
 from collections.abc import Callable
@@ -37,6 +38,11 @@ DEFAULT_MAX_RETRIES_BACKPRESSURE = 20
 DEFAULT_MAX_RETRIES_OTHER = 5
 DEFAULT_TIMEOUT = 300
 
+# Connection pool sized above the highest expected concurrency so concurrent
+# requests never queue on the pool, with keep-alive connections amortizing
+# TCP/TLS handshakes across the batch
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
 # Retry backoff configuration
 # multiplier: Base wait time in seconds for exponential backoff
 # max_wait: Maximum wait time limit in seconds
@@ -45,6 +51,27 @@ DEFAULT_TIMEOUT = 300
 DEFAULT_RETRY_MULTIPLIER = 5
 DEFAULT_RETRY_MAX_WAIT = 60
 
+# Validation error patterns (not backpressure) compiled into a single
+# alternation so each error message is scanned once instead of per pattern
+_VALIDATION_ERROR_PATTERN = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in (
+            "extra inputs are not permitted",
+            "invalid parameter",
+            "parameter validation",
+            "required parameter",
+            "missing parameter",
+            "invalid format",
+            "not a valid",
+        )
+    )
+)
+
+# Status codes retried as backpressure; frozenset gives a hashed membership
+# test on the retry hot path instead of a tuple scan
+_BACKPRESSURE_STATUS_CODES = frozenset((codes.TOO_MANY_REQUESTS, codes.SERVICE_UNAVAILABLE))
+
 
 @dataclass
 class BatchInferenceRequest:
@@ -64,7 +91,7 @@ class BatchInferenceRequest:
     few_shots: list[dict[str, str]] | None = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """
     A class to represent token usage information from an API response.
@@ -80,7 +107,7 @@ class TokenUsage:
     total_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchInferenceResponse:
     """
     A class to represent a single response from a batch inference process.
@@ -268,15 +295,37 @@ class AsyncChatClient:
             max_retries_other (int): Maximum number of retries for other errors.
             log_level (int | str): The logging level for the client.
         """
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = httpx.AsyncClient(timeout=timeout, limits=DEFAULT_CONNECTION_LIMITS)
+        # One credentials accessor for the client's lifetime; each predict
+        # still fetches fresh host/token values through it
+        self.credentials = DatabricksCredentials()
         self.endpoint_name = endpoint_name
         self.request_params = request_params
         self.max_retries_backpressure = max_retries_backpressure
         self.max_retries_other = max_retries_other
         self.logger = setup_logger('AsyncChatClient', level=log_level)
+        # URL and headers derived from the last seen (host, token) pair;
+        # rebuilt only when the credentials actually rotate
+        self._cached_credentials: tuple[str, str] | None = None
+        self._cached_url_and_headers: tuple[str, dict[str, str]] | None = None
         self.logger.info(f"Initialized AsyncChatClient with endpoint: {endpoint_name}")
         self.logger.info(f"Request parameters: {self.request_params}")
 
+    def _get_url_and_headers(self) -> tuple[str, dict[str, str]]:
+        """Return the invocation URL and auth headers for the current credentials."""
+        host_and_token = self.credentials.get_host_and_token()
+        credentials_key = (host_and_token["host"], host_and_token["token"])
+        if credentials_key != self._cached_credentials:
+            self._cached_credentials = credentials_key
+            self._cached_url_and_headers = (
+                f"{credentials_key[0]}/serving-endpoints/{self.endpoint_name}/invocations",
+                {
+                    "Authorization": f"Bearer {credentials_key[1]}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._cached_url_and_headers
+
     async def predict(self, request: 'BatchInferenceRequest') -> tuple[str, TokenUsage]:
         """
         Send a prediction request to the API and process the response.
@@ -304,15 +353,7 @@ class AsyncChatClient:
         )
         async def _predict_with_retry():  # pylint: disable=too-many-locals
             try:  # pylint: disable=too-many-try-statements
-                databricks_host_and_token = DatabricksCredentials().get_host_and_token()
-                databricks_host = databricks_host_and_token["host"]
-                databricks_token = databricks_host_and_token["token"]
-
-                url = f"{databricks_host}/serving-endpoints/{self.endpoint_name}/invocations"
-                headers = {
-                    "Authorization": f"Bearer {databricks_token}",
-                    "Content-Type": "application/json",
-                }
+                url, headers = self._get_url_and_headers()
 
                 messages = self._initialize_messages(request)
                 total_content = ""
@@ -320,21 +361,24 @@ class AsyncChatClient:
                 completion_tokens = 0
                 total_tokens = 0
 
+                # Build the request body once; it holds a reference to the
+                # messages list, so continuation appends are picked up without
+                # re-merging request_params on every iteration
+                request_body = {"messages": messages}
+                if self.request_params:
+                    request_body.update(self.request_params)
+                request_args = {'url': url, 'headers': headers, 'json': request_body}
+
                 while True:
-                    # Prepare the request body with the current messages
-                    request_body = {"messages": messages}
-                    if self.request_params:
-                        request_body.update(self.request_params)
-                    request_args = {'url': url, 'headers': headers, 'json': request_body}
                     self._log_request_args(request_args, request.index, level=logging.INFO)
 
                     # Send the request
                     response = await self.client.post(**request_args)
                     response.raise_for_status()
-                    self._log_response_details(response, request.index, level=logging.DEBUG)
 
-                    # Process the response data
+                    # Parse the response once and share the parsed data with logging
                     response_data = response.json()
+                    self._log_response_details(response, response_data, request.index, level=logging.DEBUG)
                     content = self._parse_content(response_data["choices"][0]["message"]["content"])
                     total_content += content
                     finish_reason = response_data["choices"][0]["finish_reason"]
@@ -584,23 +628,12 @@ class AsyncChatClient:
         """
         Check if error message matches validation error patterns (not backpressure errors).
         """
-        validation_patterns = [
-            "extra inputs are not permitted",
-            "invalid parameter",
-            "parameter validation",
-            "required parameter",
-            "missing parameter",
-            "invalid format",
-            "not a valid",
-        ]
-
-        for pattern in validation_patterns:
-            if pattern in error_msg:
-                self.logger.debug(
-                    f"Parameter validation error detected: '{error_msg}'. "
-                    f"Will not retry as this is not a backpressure issue."
-                )
-                return True
+        if _VALIDATION_ERROR_PATTERN.search(error_msg):
+            self.logger.debug(
+                f"Parameter validation error detected: '{error_msg}'. "
+                f"Will not retry as this is not a backpressure issue."
+            )
+            return True
         return False
 
     def _is_backpressure(self, error: httpx.HTTPStatusError) -> bool:
@@ -608,7 +641,7 @@ class AsyncChatClient:
         Check if the error is due to backpressure (HTTP 429 or 503) or
         if it's a 400 with null message from Databricks Claude endpoint.
         """
-        if error.response.status_code in (codes.TOO_MANY_REQUESTS, codes.SERVICE_UNAVAILABLE):
+        if error.response.status_code in _BACKPRESSURE_STATUS_CODES:
             return True
         # Treating cases where the token limit is reached in a single inference as backpressure causes excessive retries, so it is temporarily commented out.
         # if self._is_databricks_claude_specific_backpressure(error):
@@ -654,6 +687,11 @@ class AsyncChatClient:
             max_tail: Maximum number of characters to log from the end of the request body
             level: The logging level to use (default is INFO)
         """
+        # Serializing the full request body is expensive; skip it entirely
+        # when the record would be discarded anyway
+        if not self.logger.isEnabledFor(level):
+            return
+
         request_body = request_args.get('json', {})
         body_str = json.dumps(request_body, ensure_ascii=False)
         body_len = len(body_str)
@@ -667,6 +705,7 @@ class AsyncChatClient:
     def _log_response_details(
         self,
         response: httpx.Response,
+        response_data: Any | None,
         request_index: int,
         max_head: int = 200,
         max_tail: int = 100,
@@ -677,17 +716,23 @@ class AsyncChatClient:
 
         Args:
             response: The HTTP response object
+            response_data: The already-parsed JSON body, or None for non-JSON responses
             request_index: Index of the request being processed
             max_head: Maximum characters to show from the beginning for text content
             max_tail: Maximum characters to show from the end for text content
             level: The logging level to use (default is DEBUG)
         """
-        try:
+        # The truncation walk and re-serialization of the body are wasted work
+        # unless the record will actually be emitted
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if response_data is not None:
             # For JSON responses, use the dictionary truncation method
-            log_data = self._truncate_long_strings_in_dict(response.json())
+            log_data = self._truncate_long_strings_in_dict(response_data)
             body_content = json.dumps(log_data, ensure_ascii=False)
             content_type = "JSON"
-        except json.JSONDecodeError:
+        else:
             # For non-JSON responses, use simple text truncation
             body_str = response.text
             body_content = f"{body_str[:max_head]}... [truncated] ...{body_str[-max_tail:]}"
@@ -705,7 +750,11 @@ class AsyncChatClient:
         self, data: dict | list | str | Any, max_length: int = 2000
     ) -> dict | list | str | Any:
         """
-        Recursively truncate long string values in a dictionary or list.
+        Truncate long string values in a dictionary or list.
+
+        Uses an explicit stack instead of recursion so deeply nested response
+        payloads cannot hit the interpreter recursion limit and container
+        traversal avoids a Python function call per element.
 
         Args:
             data: The dictionary or list to process
@@ -714,18 +763,40 @@ class AsyncChatClient:
         Returns:
             A copy of the data with long strings truncated
         """
-        if isinstance(data, dict):
-            return {k: self._truncate_long_strings_in_dict(v, max_length) for k, v in data.items()}
-        if isinstance(data, list):
-            return [self._truncate_long_strings_in_dict(item, max_length) for item in data]
-        if isinstance(data, str) and len(data) > max_length:
-            # Truncate long string values
+
+        def _truncate(value: str) -> str:
             return (
-                data[: max_length // 2]
-                + f" ... [truncated {len(data) - max_length} chars] ... "
-                + data[-max_length // 2 :]
+                value[: max_length // 2]
+                + f" ... [truncated {len(value) - max_length} chars] ... "
+                + value[-max_length // 2 :]
             )
-        return data
+
+        if isinstance(data, str):
+            return _truncate(data) if len(data) > max_length else data
+        if not isinstance(data, (dict, list)):
+            return data
+
+        # Copy the top-level container, then rewrite nested values in place on
+        # the copies; the stack holds (container copy, key/index, value) work items
+        result = dict(data) if isinstance(data, dict) else list(data)
+        stack: list[tuple[dict | list, Any, Any]] = (
+            [(result, k, v) for k, v in result.items()]
+            if isinstance(result, dict)
+            else [(result, i, v) for i, v in enumerate(result)]
+        )
+        while stack:
+            container, key, value = stack.pop()
+            if isinstance(value, dict):
+                copied = dict(value)
+                container[key] = copied
+                stack.extend((copied, k, v) for k, v in copied.items())
+            elif isinstance(value, list):
+                copied = list(value)
+                container[key] = copied
+                stack.extend((copied, i, v) for i, v in enumerate(copied))
+            elif isinstance(value, str) and len(value) > max_length:
+                container[key] = _truncate(value)
+        return result
 
 
 class AsyncCounter:
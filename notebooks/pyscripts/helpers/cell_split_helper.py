@@ -2,6 +2,7 @@
 
 import ast
 import logging
+import re
 
 from ..utils.common_utils import setup_logger
 
@@ -23,6 +24,10 @@ class CellSplitHelper:
 
     COMMAND_MARKER = "# COMMAND ----------"
 
+    # Matches a run of two or more consecutive COMMAND_MARKER lines so they
+    # can be collapsed in a single pass
+    _CONSECUTIVE_MARKERS_PATTERN = re.compile(f"(?:{re.escape(COMMAND_MARKER)}\n)+(?={re.escape(COMMAND_MARKER)})")
+
     def __init__(self, log_level: int | str = logging.INFO):
         self.logger = setup_logger('CellSplitHelper', log_level)
 
@@ -134,8 +139,8 @@ class CellSplitHelper:
 
             if block_start <= block_end:
                 output_lines.append(self.COMMAND_MARKER)
-                for line_num in range(block_start, block_end + 1):
-                    output_lines.append(lines[line_num - 1])
+                # Copy the block as a list slice instead of appending line by line
+                output_lines.extend(lines[block_start - 1 : block_end])
                 last_used_line = max(last_used_line, block_end)
 
         return output_lines
@@ -174,6 +179,9 @@ class CellSplitHelper:
         self.logger.debug(f"Merging nearby nodes, initial count: {len(nodes)}")
         if not nodes:
             return []
+        # A single node cannot merge with anything; skip the scan
+        if len(nodes) == 1:
+            return list(nodes)
 
         merged_blocks = []
         cur_start, cur_end = nodes[0]
@@ -230,15 +238,17 @@ class CellSplitHelper:
 
     def _get_node_end_line(self, node: ast.AST) -> int | None:
         """
-        Recursively get the end line of an AST node.
+        Get the end line of an AST node.
         This method determines the last line of a given AST node by checking its
-        end_lineno attribute if available, or recursively checking its child nodes.
+        end_lineno attribute if available, or traversing its child nodes.
 
         The algorithm works as follows:
         1. If the node has an end_lineno attribute, return its value.
         2. Otherwise, start with the node's lineno as the maximum line.
-        3. Recursively check all child nodes:
-           - If a child's end line is greater than the current maximum, update the maximum.
+        3. Walk all descendants with an explicit stack (avoiding recursion depth
+           limits on deeply nested code):
+           - A descendant with end_lineno contributes it directly and is not expanded further.
+           - Otherwise its lineno is considered and its children are pushed.
         4. Return the maximum line number found, or None if no valid line number was found.
 
         Args:
@@ -247,13 +257,18 @@ class CellSplitHelper:
         Returns:
             int | None: The end line number of the node, or None if not found.
         """
-        if hasattr(node, "end_lineno") and node.end_lineno is not None:
+        if getattr(node, "end_lineno", None) is not None:
             return node.end_lineno
         max_line = getattr(node, "lineno", 0)
-        for child in ast.iter_child_nodes(node):
-            child_end = self._get_node_end_line(child)
-            if child_end and child_end > max_line:
-                max_line = child_end
+        stack = list(ast.iter_child_nodes(node))
+        while stack:
+            current = stack.pop()
+            end_line = getattr(current, "end_lineno", None)
+            if end_line is not None:
+                max_line = max(max_line, end_line)
+                continue
+            max_line = max(max_line, getattr(current, "lineno", 0))
+            stack.extend(ast.iter_child_nodes(current))
         return max_line if max_line != 0 else None
 
     def _pull_up_leading_comments_and_blank_lines(self, start_line: int, lines: list[str], limit_line: int) -> int:
@@ -308,8 +323,8 @@ class CellSplitHelper:
         Returns:
             str: The code with merged COMMAND_MARKER lines.
         """
-        marker = self.COMMAND_MARKER
-        double_marker = f"{marker}\n{marker}"
-        while double_marker in code:
-            code = code.replace(double_marker, marker)
-        return code
+        # Most split results have no adjacent markers; a plain substring scan
+        # is cheaper than the regex pass it would make redundant
+        if f"{self.COMMAND_MARKER}\n{self.COMMAND_MARKER}" not in code:
+            return code
+        return self._CONSECUTIVE_MARKERS_PATTERN.sub("", code)
@@ -1,5 +1,7 @@
 """Conversion prompt management and YAML configuration handling."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
@@ -12,6 +14,27 @@ from ..types.sdp_language import SDPLanguage
 from ..types.target_type import TargetType
 
 
+@lru_cache(maxsize=None)
+def _read_yaml_file(path_str: str) -> dict:
+    """Read and parse a YAML file, caching the result per path.
+
+    The common instruction YAML is shared by every prompt configuration, so
+    caching the parse avoids re-reading it for each custom prompt.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the YAML content is not a dictionary.
+    """
+    path = Path(path_str)
+    if not path.exists():
+        raise FileNotFoundError(f"YAML file not found: {path}")
+    with open(path, 'r', encoding='utf-8') as f:
+        yaml_content = yaml.safe_load(f)
+    if not isinstance(yaml_content, dict):
+        raise ValueError(f"YAML content must be a dictionary: {path}")
+    return yaml_content
+
+
 class FewShot(TypedDict):
     """Type definition for few-shot examples in the conversion process.
 
@@ -76,6 +99,10 @@ class PromptConfig:
     This class handles loading and managing prompt configurations from YAML files.
     """
 
+    # Merged prompt dictionaries cached per (yaml path, target type, SDP
+    # language) so repeated configs skip YAML parsing and OmegaConf resolution
+    _MERGED_PROMPTS_CACHE: dict[tuple, dict] = {}
+
     def __init__(
         self,
         conversion_prompt_yaml: str,
@@ -96,6 +123,7 @@ class PromptConfig:
         self.target_type = target_type
         self.sdp_language = sdp_language
         self._prompts = self._load_prompts()
+        self._system_message: str | None = None
 
     def get_system_message(self) -> str:
         """Get system message with comment language interpolated.
@@ -103,10 +131,14 @@ class PromptConfig:
         Returns:
             The system message with the comment language placeholders replaced.
         """
-        system_message = self._prompts["system_message"]
-        if self.comment_lang:
-            system_message = system_message.replace("{comment_lang}", self.comment_lang)
-        return system_message
+        # The interpolated message never changes for a given config, so format
+        # it once and reuse it for every request in the batch
+        if self._system_message is None:
+            system_message = self._prompts["system_message"]
+            if self.comment_lang:
+                system_message = system_message.replace("{comment_lang}", self.comment_lang)
+            self._system_message = system_message
+        return self._system_message
 
     def get_few_shots(self) -> list[FewShot]:
         """Get few-shot examples from the loaded prompts.
@@ -127,6 +159,11 @@ class PromptConfig:
             ValueError: If the YAML content is invalid or missing required keys.
             RuntimeError: If prompt loading fails for any other reason.
         """
+        cache_key = (self.conversion_prompt_yaml, self.target_type, self.sdp_language)
+        cached = self._MERGED_PROMPTS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             common_yaml_path = BuiltinPrompt.get_common_instruction_path(self.target_type, self.sdp_language)
             common_yaml = self._load_yaml_file(common_yaml_path)
@@ -134,6 +171,7 @@ class PromptConfig:
             prompts = self._merge_yaml_files(common_yaml, custom_yaml)
             if "system_message" not in prompts:
                 raise ValueError("YAML must contain 'system_message' key")
+            self._MERGED_PROMPTS_CACHE[cache_key] = prompts
             return prompts
         except (FileNotFoundError, ValueError):
             raise
@@ -154,14 +192,8 @@ class PromptConfig:
             FileNotFoundError: If the file does not exist.
             ValueError: If the YAML content is not a dictionary.
         """
-        path = Path(file_path) if not isinstance(file_path, Path) else file_path
-        if not path.exists():
-            raise FileNotFoundError(f"YAML file not found: {path}")
-        with open(path, 'r', encoding='utf-8') as f:
-            yaml_content = yaml.safe_load(f)
-        if not isinstance(yaml_content, dict):
-            raise ValueError(f"YAML content must be a dictionary: {path}")
-        return yaml_content
+        # Deep-copied so callers can merge/mutate without corrupting the cache
+        return copy.deepcopy(_read_yaml_file(str(file_path)))
 
     @staticmethod
     def _merge_yaml_files(common_yaml: dict, custom_yaml: dict) -> dict:
@@ -1,6 +1,7 @@
 """File token counting and analysis for LLM processing optimization."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from ..utils import token_utils
@@ -8,6 +9,9 @@ from ..utils.token_utils import ClaudeTokenCounter, ClaudeConfig
 from ..utils import common_utils as utils
 from ..types.source_format import SourceFormat
 
+# Compiled once; applied to every SQL file during token counting
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 @dataclass
 class FileTokenMetadata:
@@ -70,13 +74,25 @@ class FileTokenCountHelper:
         Returns:
             list[FileTokenMetadata]: A list of metadata objects for each processed file.
         """
-        results = []
-        for i, file_path in enumerate(utils.expand_input_paths(input_dir), start=1):
-            sql_file_token_metadata = self.process_file(
-                input_file_path=file_path, input_file_number=i, file_encoding=file_encoding, source_format=source_format
+        file_paths = utils.expand_input_paths(input_dir)
+        if not file_paths:
+            return []
+
+        # Per-file work is dominated by file I/O and encoding detection, so a
+        # thread pool overlaps it across files; executor.map preserves input
+        # order in its results
+        def _process(numbered_path: tuple[int, str]) -> FileTokenMetadata:
+            input_file_number, file_path = numbered_path
+            return self.process_file(
+                input_file_path=file_path,
+                input_file_number=input_file_number,
+                file_encoding=file_encoding,
+                source_format=source_format,
             )
-            results.append(sql_file_token_metadata)
-        return results
+
+        max_workers = min(8, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_process, enumerate(file_paths, start=1)))
 
     def process_file(
         self,
@@ -105,7 +121,7 @@ class FileTokenCountHelper:
 
         if source_format == SourceFormat.SQL:
             content_preprocessed = utils.remove_sql_comments(content)
-            content_preprocessed = re.sub(r'\s+', ' ', content_preprocessed)
+            content_preprocessed = _WHITESPACE_PATTERN.sub(' ', content_preprocessed)
             token_count_preprocessed = self.token_counter.count_tokens(content_preprocessed)
         else:
             # For generic files, use original content (no preprocessing)
@@ -88,14 +88,19 @@ class NotebookExportHelper:
             list[ExportOutput]: List of output objects with notebook details
         """
         results = []
-        output_paths = self.generate_output_paths(exporter_inputs)
 
-        for exporter_input, output_file_path in zip(exporter_inputs, output_paths):
-            # Skip if code is None or empty
+        # Skip inputs with no code up front so output paths are only generated
+        # for files that will actually be exported
+        valid_inputs = []
+        for exporter_input in exporter_inputs:
             if not exporter_input.code:
                 print(f"Skipping file due to empty code: {exporter_input.input_file_path}")
                 continue
+            valid_inputs.append(exporter_input)
 
+        output_paths = self.generate_output_paths(valid_inputs)
+
+        for exporter_input, output_file_path in zip(valid_inputs, output_paths):
             # Create Databricks notebook content and encode with base64
             notebook_content = self.create_notebook_content(output_file_path=output_file_path, ex_in=exporter_input)
             encoded_content = base64.b64encode(notebook_content.encode('utf-8')).decode('utf-8')
@@ -139,7 +144,9 @@ class NotebookExportHelper:
         comment_marker = self.COMMENT_MARKERS.get(ex_in.notebook_language.lower(), "#")
         notebook_name = os.path.basename(output_file_path)
         messages = MessageManager.get_all_messages(CommentLanguage(ex_in.comment_lang))
-        notebook_content = (
+        # Collect the content as parts and join once at the end; repeated
+        # string += would recopy the (potentially large) code section
+        parts = [
             f"{comment_marker} Databricks notebook source\n"
             f"{comment_marker} MAGIC %md\n"
             f"{comment_marker} MAGIC # {notebook_name}\n"
@@ -151,30 +158,29 @@ class NotebookExportHelper:
             f"{comment_marker} COMMAND ----------\n"
             f"{comment_marker} MAGIC %md\n"
             f"{comment_marker} MAGIC ## {messages[MessageKey.SYNTAX_CHECK_RESULTS]}\n"
-        )
+        ]
         if ex_in.python_parse_error or ex_in.sql_parse_error:
-            notebook_content += f"{comment_marker} MAGIC {messages[MessageKey.ERRORS_FROM_CHECKS]}\n"
+            parts.append(f"{comment_marker} MAGIC {messages[MessageKey.ERRORS_FROM_CHECKS]}\n")
             if ex_in.python_parse_error:
-                notebook_content += (
+                parts.append(
                     f"{comment_marker} MAGIC ### {messages[MessageKey.PYTHON_SYNTAX_ERRORS]}\n"
                     f"{comment_marker} MAGIC ```\n"
                     f"{comment_marker} MAGIC {ex_in.python_parse_error}\n"
                     f"{comment_marker} MAGIC ```\n"
                 )
             if ex_in.sql_parse_error:
-                notebook_content += (
+                parts.append(
                     f"{comment_marker} MAGIC ### {messages[MessageKey.SPARK_SQL_SYNTAX_ERRORS]}\n"
                     f"{comment_marker} MAGIC ```\n"
                 )
-                for error in ex_in.sql_parse_error:
-                    notebook_content += f"{comment_marker} MAGIC {error}\n"
-                notebook_content += f"{comment_marker} MAGIC ```\n"
+                parts.extend(f"{comment_marker} MAGIC {error}\n" for error in ex_in.sql_parse_error)
+                parts.append(f"{comment_marker} MAGIC ```\n")
         else:
-            notebook_content += (
+            parts.append(
                 f"{comment_marker} MAGIC {messages[MessageKey.NO_ERRORS_DETECTED]}\n"
                 f"{comment_marker} MAGIC {messages[MessageKey.REVIEW_CODE]}\n"
             )
-        return notebook_content
+        return "".join(parts)
 
     def generate_output_paths(self, exporter_inputs: list[ExportInput]) -> list[str]:
         """Generates output file paths using input_file_relative_path to preserve hierarchy.
@@ -9,6 +9,18 @@ class SparkSQLExtractHelper:
     def __init__(self) -> None:
         self.sql_statements: list[str] = []
         self.variables: dict = {}
+        # Type-keyed dispatch tables so node handling is a single dict lookup
+        # instead of an isinstance chain per visited node
+        self._node_visitors = {
+            ast.Assign: self.visit_assign,
+            ast.Call: self.visit_call,
+        }
+        self._value_extractors = {
+            ast.Constant: self._extract_constant,
+            ast.JoinedStr: self.process_f_string,
+            ast.Name: self._extract_name,
+            ast.BinOp: self._extract_binop,
+        }
 
     def extract_sql_from_string(self, func_string: str) -> tuple[str | None, list[str]]:
         """
@@ -67,10 +79,9 @@ class SparkSQLExtractHelper:
             node (ast.AST): The root node of the AST tree.
         """
         for child in ast.walk(node):
-            if isinstance(child, ast.Assign):
-                self.visit_assign(child)
-            elif isinstance(child, ast.Call):
-                self.visit_call(child)
+            visitor = self._node_visitors.get(type(child))
+            if visitor is not None:
+                visitor(child)
 
     def visit_assign(self, node: ast.Assign) -> None:
         """
@@ -94,13 +105,22 @@ class SparkSQLExtractHelper:
         Returns:
             str | None: The extracted value as a string, or None if the value could not be extracted.
         """
-        if isinstance(node, ast.Constant):
-            return str(node.value)
-        if isinstance(node, ast.JoinedStr):
-            return self.process_f_string(node)
-        if isinstance(node, ast.Name):
-            return self.variables.get(node.id, "_placeholder_")
-        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        extractor = self._value_extractors.get(type(node))
+        if extractor is not None:
+            return extractor(node)
+        return None
+
+    def _extract_constant(self, node: ast.Constant) -> str:
+        """Extract the value of a constant node as a string."""
+        return str(node.value)
+
+    def _extract_name(self, node: ast.Name) -> str:
+        """Resolve a name node against known variables."""
+        return self.variables.get(node.id, "_placeholder_")
+
+    def _extract_binop(self, node: ast.BinOp) -> str | None:
+        """Extract the value of a string concatenation expression."""
+        if isinstance(node.op, ast.Add):
             left = self.extract_value(node.left)
             right = self.extract_value(node.right)
             if left and right:
@@ -2,6 +2,7 @@
 
 import json
 from dataclasses import dataclass, fields
+from functools import lru_cache
 
 from ..types.builtin_prompt import BuiltinPrompt
 from ..types.comment_language import CommentLanguage
@@ -11,6 +12,12 @@ from ..types.source_format import SourceFormat
 from ..types.target_type import TargetType
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> frozenset[str]:
+    """Collect dataclass field names once per class instead of per from_dict call."""
+    return frozenset(f.name for f in fields(cls))
+
+
 @dataclass
 class SwitchConfig:
     """Switch configuration from switch_config.yml."""
@@ -45,7 +52,7 @@ class SwitchConfig:
         "info" -> "INFO"). If normalization fails, the original value is preserved and will be
         validated later by the validator.
         """
-        field_names = {f.name for f in fields(cls)}
+        field_names = _field_names(cls)
         filtered_data = {}
         for key, value in data.items():
             if key in field_names:
@@ -73,7 +80,7 @@ class LakebridgeConfig:
     @classmethod
     def from_dict(cls, data: dict) -> "LakebridgeConfig":
         """Create LakebridgeConfig from dict, ignoring unknown fields."""
-        field_names = {f.name for f in fields(cls)}
+        field_names = _field_names(cls)
         filtered_data = {k: v for k, v in data.items() if k in field_names}
         return cls(**filtered_data)
 
@@ -93,6 +100,27 @@ class SwitchParameters:  # pylint: disable=too-many-instance-attributes
     Automatically resolves conversion_prompt_yaml from source_tech if not set.
     """
 
+    __slots__ = (
+        'target_type',
+        'source_format',
+        'comment_lang',
+        'log_level',
+        'token_count_threshold',
+        'concurrency',
+        'max_fix_attempts',
+        'conversion_prompt_yaml',
+        'output_extension',
+        'sql_output_dir',
+        'request_params',
+        'sdp_language',
+        'catalog',
+        'schema',
+        'foundation_model',
+        'input_dir',
+        'output_dir',
+        'source_tech',
+    )
+
     # Switch config fields
     target_type: str | None
     source_format: str | None
@@ -150,10 +178,15 @@ class SwitchParameters:  # pylint: disable=too-many-instance-attributes
         self.output_dir = output_dir
         self.source_tech = source_tech
 
+        # Canonicalize to leading-dot form once at parameter load so downstream
+        # path generation never re-normalizes per exported file
+        if self.output_extension and not self.output_extension.startswith('.'):
+            self.output_extension = '.' + self.output_extension
+
         # Resolve conversion_prompt_yaml from source_tech if not set
         if self.source_tech and not self.conversion_prompt_yaml:
             self.conversion_prompt_yaml = str(BuiltinPrompt.from_name(self.source_tech).path)
 
     def __str__(self) -> str:
         """Return string representation of all parameters."""
-        return json.dumps(self.__dict__, ensure_ascii=False, indent=2)
+        return json.dumps({name: getattr(self, name) for name in self.__slots__}, ensure_ascii=False, indent=2)
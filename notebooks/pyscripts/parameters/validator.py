@@ -9,6 +9,18 @@ from ..types.source_format import SourceFormat
 from ..types.target_type import TargetType
 from .models import SwitchParameters
 
+# Supported enum values resolved once at import time; validation runs on
+# every orchestration entry and should not re-query the enum classes
+_SUPPORTED_TARGET_TYPES = tuple(TargetType.get_supported_values())
+_SUPPORTED_SOURCE_FORMATS = tuple(SourceFormat.get_supported_values())
+_SUPPORTED_COMMENT_LANGS = tuple(CommentLanguage.get_supported_values())
+_SUPPORTED_LOG_LEVELS = tuple(LogLevel.get_supported_values())
+_SUPPORTED_SDP_LANGUAGES = tuple(SDPLanguage.get_supported_values())
+
+# Valid workspace path roots; str.startswith with a tuple checks all
+# prefixes in one C-level call
+_WORKSPACE_PATH_PREFIXES = ("/Workspace/", "/Users/", "/Shared/")
+
 
 class SwitchParameterValidator:
     """Validates Switch parameters with error accumulation."""
@@ -28,10 +40,10 @@ class SwitchParameterValidator:
         self.errors = []
 
         # Enum validations
-        self._validate_enum(params.target_type, TargetType.get_supported_values(), "target_type")
-        self._validate_enum(params.source_format, SourceFormat.get_supported_values(), "source_format")
-        self._validate_enum(params.comment_lang, CommentLanguage.get_supported_values(), "comment_lang")
-        self._validate_enum(params.log_level, LogLevel.get_supported_values(), "log_level")
+        self._validate_enum(params.target_type, _SUPPORTED_TARGET_TYPES, "target_type")
+        self._validate_enum(params.source_format, _SUPPORTED_SOURCE_FORMATS, "source_format")
+        self._validate_enum(params.comment_lang, _SUPPORTED_COMMENT_LANGS, "comment_lang")
+        self._validate_enum(params.log_level, _SUPPORTED_LOG_LEVELS, "log_level")
 
         # Integer validations
         self._validate_positive_int(params.token_count_threshold, "token_count_threshold")
@@ -51,7 +63,7 @@ class SwitchParameterValidator:
 
         return self.errors
 
-    def _validate_enum(self, value: str | None, valid_values: list[str], param_name: str) -> None:
+    def _validate_enum(self, value: str | None, valid_values: tuple[str, ...], param_name: str) -> None:
         """Validate enum parameter against valid values."""
         if value is None:
             self.errors.append(f"{param_name} is required but got None")
@@ -96,7 +108,7 @@ class SwitchParameterValidator:
         if not path:
             self.errors.append(f"{param_name} is required")
             return
-        if not (path.startswith("/Workspace/") or path.startswith("/Users/") or path.startswith("/Shared/")):
+        if not path.startswith(_WORKSPACE_PATH_PREFIXES):
             self.errors.append(
                 f"{param_name} must be a Databricks workspace path (start with /Workspace/, /Users/, or /Shared/), got: {path}"
             )
@@ -111,7 +123,7 @@ class SwitchParameterValidator:
         if target_type == "sdp":
             if not sdp_language:
                 self.errors.append("sdp_language is required when target_type='sdp'")
-            elif sdp_language not in SDPLanguage.get_supported_values():
+            elif sdp_language not in _SUPPORTED_SDP_LANGUAGES:
                 self.errors.append(
-                    f"Invalid sdp_language: '{sdp_language}'. Supported: {', '.join(SDPLanguage.get_supported_values())}"
+                    f"Invalid sdp_language: '{sdp_language}'. Supported: {', '.join(_SUPPORTED_SDP_LANGUAGES)}"
                 )
@@ -1,5 +1,19 @@
 """Base classes for type definitions in Switch."""
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _lowercase_value_map(cls) -> dict[str, str]:
+    """Build a lowercase -> canonical value map for an enum class, once per class."""
+    return {member.value.lower(): member.value for member in cls}
+
+
+@lru_cache(maxsize=None)
+def _supported_values(cls) -> list[str]:
+    """Collect the member values of an enum class, once per class."""
+    return [member.value for member in cls]
+
 
 class CaseInsensitiveEnumMixin:
     """Case-insensitive normalization mixin for Enum classes.
@@ -31,7 +45,7 @@ class CaseInsensitiveEnumMixin:
             >>> LogLevel.get_supported_values()
             ["DEBUG", "INFO", "WARNING", "ERROR"]
         """
-        return [member.value for member in cls]
+        return _supported_values(cls)
 
     @classmethod
     def normalize(cls, value: str) -> str:
@@ -59,16 +73,10 @@ class CaseInsensitiveEnumMixin:
         if not value:
             raise ValueError(f"{cls.__name__} value cannot be empty")
 
-        supported_values = cls.get_supported_values()
-
-        # Fast path: exact match
-        if value in supported_values:
-            return value
-
-        # Case-insensitive match
-        value_lower = value.lower()
-        for valid_value in supported_values:
-            if valid_value.lower() == value_lower:
-                return valid_value  # Return original enum value
+        # Case-insensitive match via a lookup map cached per enum class
+        normalized = _lowercase_value_map(cls).get(value.lower())
+        if normalized is not None:
+            return normalized
 
+        supported_values = cls.get_supported_values()
         raise ValueError(f"Invalid {cls.__name__}: '{value}'. " f"Supported: {', '.join(supported_values)}")
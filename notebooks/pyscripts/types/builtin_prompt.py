@@ -6,6 +6,11 @@ from pathlib import Path
 from .sdp_language import SDPLanguage
 from .target_type import TargetType
 
+# Resolved once at import time; prompt path lookups happen repeatedly and
+# should not rebuild the same parent chain on each access
+_BASE_DIR = Path(__file__).parent.parent.parent.parent
+_BUILTIN_PROMPTS_DIR = _BASE_DIR / "resources" / "builtin_prompts"
+
 
 class PromptCategory(str, Enum):
     """Prompt categories matching directory structure"""
@@ -46,38 +51,16 @@ class BuiltinPrompt(str, Enum):
     @property
     def category(self) -> PromptCategory:
         """Auto-classify template category"""
-        sql_dialects = {
-            self.MSSQL,
-            self.MYSQL,
-            self.NETEZZA,
-            self.ORACLE,
-            self.POSTGRESQL,
-            self.REDSHIFT,
-            self.SNOWFLAKE,
-            self.SYNAPSE,
-            self.TERADATA,
-        }
-        etl_dialects = {
-            self.PYSPARK,
-            self.UNKNOWN_ETL,
-        }
-        if self in sql_dialects:
-            return PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK
-        if self == self.PYTHON_TO_SQL:
-            return PromptCategory.DATABRICKS_NOTEBOOK_TO_DATABRICKS_NOTEBOOK
-        if self in {self.PYTHON, self.SCALA}:
-            return PromptCategory.CODE_TO_DATABRICKS_PYTHON_NOTEBOOK
-        if self == self.AIRFLOW:
-            return PromptCategory.WORKFLOW_TO_DATABRICKS_JOBS
-        if self in etl_dialects:
-            return PromptCategory.ETL_TO_LAKEFLOW_SDP
-        raise ValueError(f"Unknown prompt category: {self.value}")
+        category = _PROMPT_CATEGORIES.get(self.value)
+        if category is None:
+            raise ValueError(f"Unknown prompt category: {self.value}")
+        return category
 
     # Properties
     @property
     def path(self) -> Path:
         """Complete absolute path to built-in prompt file"""
-        return self._base_dir() / "resources" / "builtin_prompts" / self._relative_path
+        return _BUILTIN_PROMPTS_DIR / self._relative_path
 
     @property
     def _relative_path(self) -> Path:
@@ -122,13 +105,7 @@ class BuiltinPrompt(str, Enum):
         if target_type is not None and target_type == TargetType.SDP:
             yaml_file_name = cls._get_sdp_instruction_yaml_name(sdp_language)
 
-        return cls._base_dir() / "resources" / "builtin_prompts" / "common" / yaml_file_name
-
-    # Static methods
-    @staticmethod
-    def _base_dir() -> Path:
-        """Base directory"""
-        return Path(__file__).parent.parent.parent.parent
+        return _BUILTIN_PROMPTS_DIR / "common" / yaml_file_name
 
     @classmethod
     def _get_sdp_instruction_yaml_name(cls, sdp_language: SDPLanguage) -> str:
@@ -152,3 +129,29 @@ class BuiltinPrompt(str, Enum):
             yaml_file_name = "convert_to_spark_declarative_pipeline_sql.yml"
 
         return yaml_file_name
+
+
+# Prompt-to-category dispatch table, built once at import time so that the
+# category property is a single dict lookup instead of rebuilding membership
+# sets on every access.
+_PROMPT_CATEGORIES: dict[str, PromptCategory] = {
+    # SQL dialects
+    BuiltinPrompt.MSSQL.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.MYSQL.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.NETEZZA.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.ORACLE.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.POSTGRESQL.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.REDSHIFT.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.SNOWFLAKE.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.SYNAPSE.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.TERADATA.value: PromptCategory.SQL_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    # Databricks notebook conversions
+    BuiltinPrompt.PYTHON_TO_SQL.value: PromptCategory.DATABRICKS_NOTEBOOK_TO_DATABRICKS_NOTEBOOK,
+    # Generic conversions
+    BuiltinPrompt.PYTHON.value: PromptCategory.CODE_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.SCALA.value: PromptCategory.CODE_TO_DATABRICKS_PYTHON_NOTEBOOK,
+    BuiltinPrompt.AIRFLOW.value: PromptCategory.WORKFLOW_TO_DATABRICKS_JOBS,
+    # SDP conversions
+    BuiltinPrompt.PYSPARK.value: PromptCategory.ETL_TO_LAKEFLOW_SDP,
+    BuiltinPrompt.UNKNOWN_ETL.value: PromptCategory.ETL_TO_LAKEFLOW_SDP,
+}
@@ -239,6 +239,10 @@ class MessageManager:
         messages = cls._LANGUAGE_MESSAGES[language]
         return getattr(messages, message_key.value)
 
+    # Cache of MessageKey -> str dictionaries, filled lazily per language so
+    # get_all_messages does not rebuild the same dict for every exported file
+    _ALL_MESSAGES_CACHE: dict[CommentLanguage, dict[MessageKey, str]] = {}
+
     @classmethod
     def get_all_messages(cls, language: CommentLanguage = CommentLanguage.ENGLISH) -> dict[MessageKey, str]:
         """Get all messages for the specified language
@@ -252,7 +256,13 @@ class MessageManager:
         Raises:
             KeyError: If the language is not supported
         """
+        cached = cls._ALL_MESSAGES_CACHE.get(language)
+        if cached is not None:
+            return cached
+
         if language not in cls._LANGUAGE_MESSAGES:
             raise KeyError(f"Unsupported language: {language}")
 
-        return cls._LANGUAGE_MESSAGES[language].to_dict()
+        messages = cls._LANGUAGE_MESSAGES[language].to_dict()
+        cls._ALL_MESSAGES_CACHE[language] = messages
+        return messages
@@ -9,18 +9,40 @@ from pathlib import Path
 
 import chardet
 
+# Precompiled once at import time; remove_sql_comments runs on every input
+# file during token counting so per-call pattern compilation adds up
+_SQL_LINE_COMMENT_PATTERN = re.compile(r'--.*')
+_SQL_BLOCK_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', flags=re.DOTALL)
+_MULTIPLE_EMPTY_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+# Characters that mark a path as a glob pattern rather than a literal path
+_GLOB_CHARS = frozenset('*?[')
+
+# Translation table mapping filename-invalid characters to underscores,
+# built once so sanitize_filename is a single C-level pass
+_FILENAME_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+# Names of loggers already configured by setup_logger, so repeated calls
+# (helpers are instantiated per request) skip handler teardown and rebuild
+_configured_loggers: set[str] = set()
+
 
 def setup_logger(name, level=logging.INFO):
     """Function to setup a logger that outputs to stdout"""
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    if name in _configured_loggers:
+        return logger
+
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
     if logger.hasHandlers():
         logger.handlers.clear()
     logger.addHandler(handler)
     logger.propagate = False
+    _configured_loggers.add(name)
     return logger
 
 
@@ -51,7 +73,7 @@ def expand_input_paths(input_path: str) -> list[str]:
         if not path:
             continue
 
-        if any(char in path for char in ('*', '?', '[')):
+        if not _GLOB_CHARS.isdisjoint(path):
             matched_paths = glob.glob(path, recursive=True)
             _add_files_from_paths(matched_paths, all_files, seen_files)
         else:
@@ -85,12 +107,12 @@ def list_files_recursively(input_dir: str) -> list[str]:
     Returns:
         list[str]: A list of file paths.
     """
+    # os.walk already separates files from directories via scandir, so the
+    # walk itself is the only stat pass needed; re-checking isfile per entry
+    # would double the system calls on large trees
     all_files = []
     for root, _, files in os.walk(input_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if os.path.isfile(file_path):
-                all_files.append(file_path)
+        all_files.extend(os.path.join(root, file) for file in files)
     return all_files
 
 
@@ -124,9 +146,9 @@ def remove_sql_comments(sql_text: str) -> str:
     Returns:
         str: The SQL text without comments.
     """
-    no_line_comments = re.sub(r'--.*', '', sql_text)
-    no_comments = re.sub(r'/\*.*?\*/', '', no_line_comments, flags=re.DOTALL)
-    no_comments = re.sub(r'\n\s*\n', '\n\n', no_comments)  # Remove multiple empty lines
+    no_line_comments = _SQL_LINE_COMMENT_PATTERN.sub('', sql_text)
+    no_comments = _SQL_BLOCK_COMMENT_PATTERN.sub('', no_line_comments)
+    no_comments = _MULTIPLE_EMPTY_LINES_PATTERN.sub('\n\n', no_comments)  # Remove multiple empty lines
     return no_comments
 
 
@@ -155,10 +177,7 @@ def parse_number_ranges(input_string: str) -> list[int]:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing or replacing invalid characters."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_FILENAME_SANITIZE_TABLE)
 
 
 def generate_output_path(
@@ -13,14 +13,20 @@ class DatabricksCredentials:
 
     Important: Ephemeral tokens have a short lifespan, so this class retrieves fresh values
     on each property access to ensure tokens are always valid, even after rotation.
+    Environment-variable credentials do not rotate within a process, so those are
+    cached after the first successful read.
     """
 
+    def __init__(self):
+        self._env_credentials: dict[str, str] | None = None
+
     def get_host_and_token(self) -> dict[str, str]:
         """
         Returns both host URL and authentication token as a dictionary.
 
-        The values are freshly retrieved each time this method is called
-        to ensure token validity, as Databricks ephemeral tokens might expire quickly.
+        Environment-variable credentials are resolved once and reused; dbutils
+        ephemeral tokens are freshly retrieved each time this method is called
+        to ensure token validity, as they might expire quickly.
 
         Returns:
             dict with 'host' and 'token' keys
@@ -28,12 +34,16 @@ class DatabricksCredentials:
         Raises:
             RuntimeError: If credentials cannot be retrieved from either source
         """
-        # First check environment variables
+        # First check environment variables (static for the process lifetime)
+        if self._env_credentials is not None:
+            return self._env_credentials
+
         host = os.environ.get("DATABRICKS_HOST")
         token = os.environ.get("DATABRICKS_TOKEN")
 
         if host and token:
-            return {"host": host, "token": token}
+            self._env_credentials = {"host": host, "token": token}
+            return self._env_credentials
 
         # Fallback to dbutils if environment variables not found
         try:
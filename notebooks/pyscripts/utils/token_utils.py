@@ -4,8 +4,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Protocol
 
-import tiktoken
-
 
 class TokenizerType(str, Enum):
     """Enum representing different tokenizer types"""
@@ -43,12 +41,18 @@ class OpenAITokenCounter:
 
     def __init__(self, config: OpenAIConfig):
         """Initialize with OpenAI configuration."""
+        # Imported lazily so that Claude-only runs never pay for loading
+        # tiktoken and its encoding data
+        import tiktoken  # pylint: disable=import-outside-toplevel
+
         self.config = config
         self.encoding = tiktoken.get_encoding(config.encoding)
 
     def count_tokens(self, text: str) -> int:
         """Returns the number of tokens in a text string."""
-        return len(self.encoding.encode(text))
+        # encode_ordinary skips the special-token regex scan, which is all we
+        # need for counting plain source text
+        return len(self.encoding.encode_ordinary(text))
 
     def get_type_info(self) -> tuple[str, str]:
         """Returns (tokenizer_type, model) for metadata."""
@@ -7,6 +7,7 @@
 
 # DBTITLE 1,Import Libraries
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from databricks.sdk import WorkspaceClient
@@ -24,38 +25,49 @@ class DatabricksResourceValidator:
 
     def __init__(self):
         self.errors: List[str] = []
-
-    def _check_path_exists(self, path: str, resource_name: str) -> None:
+        # One SDK client per validator, created lazily: constructing a
+        # WorkspaceClient per check repeats credential and config resolution,
+        # and validators that never reach the endpoint check skip it entirely
+        self._workspace_client: WorkspaceClient | None = None
+
+    @property
+    def workspace_client(self) -> WorkspaceClient:
+        """SDK client, created on first use and reused afterwards."""
+        if self._workspace_client is None:
+            self._workspace_client = WorkspaceClient()
+        return self._workspace_client
+
+    def _check_path_exists(self, path: str, resource_name: str) -> List[str]:
         """Check if path exists for a given resource."""
         if not os.path.exists(path):
-            self.errors.append(f"{resource_name} does not exist or is not accessible: {path}")
+            return [f"{resource_name} does not exist or is not accessible: {path}"]
+        return []
 
-    def _check_catalog_schema(self, catalog: str, schema: str) -> None:
+    def _check_catalog_schema(self, catalog: str, schema: str) -> List[str]:
         """Validate Unity Catalog and schema."""
+        # A single SHOW SCHEMAS IN <catalog> answers both questions in one
+        # round trip: it fails if the catalog is missing and lists schemas
+        # otherwise, replacing the SHOW CATALOGS / USE CATALOG / SHOW SCHEMAS
+        # sequence
         try:
-            catalogs = [row.catalog for row in spark.sql("SHOW CATALOGS").collect()]
-            if catalog not in catalogs:
-                self.errors.append(f"Catalog does not exist: {catalog}")
-            else:
-                try:
-                    spark.sql(f"USE CATALOG `{catalog}`")
-                    schemas = [row.databaseName for row in spark.sql("SHOW SCHEMAS").collect()]
-                    if schema not in schemas:
-                        self.errors.append(f"Schema '{schema}' does not exist in catalog '{catalog}'")
-                except Exception as e:
-                    self.errors.append(f"Error accessing catalog '{catalog}': {e}")
+            schemas = [row.databaseName for row in spark.sql(f"SHOW SCHEMAS IN `{catalog}`").collect()]
+            if schema not in schemas:
+                return [f"Schema '{schema}' does not exist in catalog '{catalog}'"]
         except AnalysisException as e:
-            self.errors.append(f"Error checking catalog/schema: {e}")
+            if "CATALOG" in str(e).upper():
+                return [f"Catalog does not exist: {catalog}"]
+            return [f"Error checking catalog/schema: {e}"]
         except Exception as e:
-            self.errors.append(f"Unexpected error validating catalog/schema: {e}")
+            return [f"Unexpected error validating catalog/schema: {e}"]
+        return []
 
-    def _check_serving_endpoint(self, endpoint_name: str) -> None:
+    def _check_serving_endpoint(self, endpoint_name: str) -> List[str]:
         """Check if serving endpoint exists."""
         try:
-            w = WorkspaceClient()
-            w.serving_endpoints.get(endpoint_name)
+            self.workspace_client.serving_endpoints.get(endpoint_name)
         except Exception:
-            self.errors.append(f"Serving endpoint does not exist or is not accessible: {endpoint_name}")
+            return [f"Serving endpoint does not exist or is not accessible: {endpoint_name}"]
+        return []
 
     def validate(self, params: SwitchParameters) -> List[str]:
         """
@@ -69,11 +81,20 @@ class DatabricksResourceValidator:
         """
         self.errors = []
 
-        # Check each resource using dataclass attributes
-        self._check_path_exists(params.input_dir, "Input directory")
-        self._check_catalog_schema(params.catalog, params.schema)
-        self._check_serving_endpoint(params.foundation_model)
-        self._check_path_exists(params.conversion_prompt_yaml, "Conversion YAML file")
+        # The checks hit independent services (filesystem, Spark SQL, model
+        # serving), so run them concurrently; total wait becomes the slowest
+        # check rather than the sum. Results are collected in declaration
+        # order to keep error reports deterministic.
+        checks = (
+            lambda: self._check_path_exists(params.input_dir, "Input directory"),
+            lambda: self._check_catalog_schema(params.catalog, params.schema),
+            lambda: self._check_serving_endpoint(params.foundation_model),
+            lambda: self._check_path_exists(params.conversion_prompt_yaml, "Conversion YAML file"),
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            for future in futures:
+                self.errors.extend(future.result())
 
         return self.errors
 